@@ -158,7 +158,9 @@ class AudioMixer:
                 # whereas the energy ratio applies to power quantities. To compute the gain correctly,
                 # we need to take a square root of the energy ratio.
                 gain = sqrt(target_energy / added_audio_energy)
-        self.tracks.append(gain * audio)
+        # Avoid copying the track when no gain is applied - the mixer never
+        # mutates the stored tracks, so keeping a reference is safe.
+        self.tracks.append(gain * audio if gain != 1.0 else audio)
         self.offsets.append(num_samples_offset)
         # We cannot mix 2 multi-channel audios with different number of channels.
         if (
@@ -102,7 +102,11 @@ class RecordingSet(Serializable, AlgorithmMixin):
 
     @staticmethod
     def from_recordings(recordings: Iterable[Recording]) -> "RecordingSet":
-        return RecordingSet(list(recordings))
+        # The manifest never mutates its backing list, so an input list
+        # can be taken as-is without a defensive copy.
+        return RecordingSet(
+            recordings if isinstance(recordings, list) else list(recordings)
+        )
 
     from_items = from_recordings
 
@@ -14,6 +14,7 @@ def test(target_dir: Pathlike):
 @prepare.command(context_settings=dict(show_default=True))
 @click.argument("corpus_dir", type=click.Path(exists=True, dir_okay=True))
 @click.argument("output_dir", type=click.Path())
-def test(corpus_dir: Pathlike, output_dir: Pathlike):
+@click.option("--num-jobs", "-j", type=int, default=1, help="Number of parallel jobs.")
+def test(corpus_dir: Pathlike, output_dir: Pathlike, num_jobs: int = 1):
     """yes_no data preparation."""
-    prepare_test(corpus_dir, output_dir=output_dir)
+    prepare_test(corpus_dir, output_dir=output_dir, num_jobs=num_jobs)
@@ -48,5 +48,6 @@ from .mfcc import TorchaudioMfcc, TorchaudioMfccConfig
 from .mixer import FeatureMixer
 from .opensmile import OpenSmileConfig, OpenSmileExtractor
 from .spectrogram import TorchaudioSpectrogram, TorchaudioSpectrogramConfig
+from .spectrograms_fbank import SpectrogramsFbank, SpectrogramsFbankConfig
 from .ssl import S3PRLSSL, S3PRLSSLConfig
 from .whisper_fbank import WhisperFbank, WhisperFbankConfig
@@ -0,0 +1,114 @@
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from lhotse.features.base import FeatureExtractor, register_extractor
+from lhotse.utils import EPSILON, Seconds, is_module_available
+
+
+@dataclass
+class SpectrogramsFbankConfig:
+    sampling_rate: int = 16000
+    frame_length: Seconds = 0.025
+    frame_shift: Seconds = 0.01
+    num_mel_bins: int = 80
+    low_freq: float = 20.0
+    high_freq: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "SpectrogramsFbankConfig":
+        return SpectrogramsFbankConfig(**data)
+
+
+@register_extractor
+class SpectrogramsFbank(FeatureExtractor):
+    """Log Mel energy filter bank feature extractor based on the ``spectrograms``
+    package (Rust bindings).
+
+    Differs from Fbank extractor in that the STFT plan and mel filterbank are
+    built once and reused across ``extract()`` calls, and the computation
+    releases the GIL.
+    """
+
+    name = "spectrograms-fbank"
+    config_type = SpectrogramsFbankConfig
+
+    def __init__(self, config: Optional[SpectrogramsFbankConfig] = None):
+        super().__init__(config=config)
+        self._params = None
+        self._mel_params = None
+
+    def _init_params(self) -> None:
+        if not is_module_available("spectrograms"):
+            raise ImportError(
+                "spectrograms is not installed. Please install spectrograms "
+                "before using SpectrogramsFbank extractor (pip install spectrograms)."
+            )
+        from spectrograms import MelParams, SpectrogramParams, StftParams
+
+        sampling_rate = self.config.sampling_rate
+        self._params = SpectrogramParams(
+            stft=StftParams(
+                sampling_rate=sampling_rate,
+                window_length=round(self.config.frame_length * sampling_rate),
+                hop_length=round(self.config.frame_shift * sampling_rate),
+            )
+        )
+        self._mel_params = MelParams(
+            num_mel_bins=self.config.num_mel_bins,
+            low_freq=self.config.low_freq,
+            high_freq=(
+                self.config.high_freq
+                if self.config.high_freq is not None
+                else sampling_rate / 2
+            ),
+        )
+
+    @property
+    def frame_shift(self) -> Seconds:
+        return self.config.frame_shift
+
+    def feature_dim(self, sampling_rate: int) -> int:
+        return self.config.num_mel_bins
+
+    def extract(self, samples: np.ndarray, sampling_rate: int) -> np.ndarray:
+        assert sampling_rate == self.config.sampling_rate, (
+            f"SpectrogramsFbank was instantiated for sampling_rate "
+            f"{self.config.sampling_rate}, but sampling_rate={sampling_rate} was passed to extract()."
+        )
+        if self._params is None:
+            self._init_params()
+        from spectrograms import compute_mel_power_spectrogram
+
+        if samples.ndim == 2:
+            assert samples.shape[0] == 1, (
+                f"SpectrogramsFbank works only with single-channel recordings "
+                f"(shape: {samples.shape})"
+            )
+            samples = samples[0]
+        feats = compute_mel_power_spectrogram(
+            np.ascontiguousarray(samples, dtype=np.float64),
+            self._params,
+            self._mel_params,
+        )
+        return np.log(np.maximum(EPSILON, feats)).astype(np.float32)
+
+    @staticmethod
+    def mix(
+        features_a: np.ndarray, features_b: np.ndarray, energy_scaling_factor_b: float
+    ) -> np.ndarray:
+        return np.log(
+            np.maximum(
+                # protection against log(0); max with EPSILON is adequate since these are energies (always >= 0)
+                EPSILON,
+                np.exp(features_a) + energy_scaling_factor_b * np.exp(features_b),
+            )
+        )
+
+    @staticmethod
+    def compute_energy(features: np.ndarray) -> float:
+        return float(np.sum(np.exp(features)))
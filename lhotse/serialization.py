@@ -1,3 +1,4 @@
+import gzip
 import itertools
 import json
 import os
@@ -172,6 +173,26 @@ def save_to_jsonl(data: Iterable[Dict[str, Any]], path: Pathlike) -> None:
             print(json.dumps(item, ensure_ascii=False), file=f)
 
 
+def save_to_jsonl_compact(
+    data: Iterable[Dict[str, Any]], path: Pathlike, compresslevel: int = 4
+) -> None:
+    """Save the data to a JSONL file in a single write.
+
+    The whole manifest is serialized into one buffer and, for paths with
+    a ``.gz`` extension, compressed with a single ``gzip.compress`` call,
+    which is considerably faster than per-line writes through a gzip
+    stream for small manifests. Use :func:`save_to_jsonl` for manifests
+    too large to comfortably hold serialized in memory.
+    """
+    buf = "\n".join(json.dumps(item, ensure_ascii=False) for item in data)
+    if buf:
+        buf += "\n"
+    raw = buf.encode("utf-8")
+    if str(path).endswith(".gz"):
+        raw = gzip.compress(raw, compresslevel=compresslevel)
+    Path(path).write_bytes(raw)
+
+
 def load_jsonl(path: Pathlike) -> Generator[Dict[str, Any], None, None]:
     """Load a JSON file. Also supports compressed JSON with a ``.gz`` extension."""
     with open_best(path, "r") as f:
@@ -577,6 +598,19 @@ class Serializable(JsonMixin, JsonlMixin, LazyMixin, YamlMixin):
     def to_file(self, path: Pathlike) -> None:
         store_manifest(self, path)
 
+    def to_file_compact(self, path: Pathlike) -> None:
+        """
+        Like :meth:`.to_file`, but serializes the whole manifest in one shot,
+        compressing it (for ``.gz`` paths) with a single ``gzip.compress``
+        call. Faster for small manifests; requires materializing the
+        serialized manifest in memory. Non-JSONL paths fall back to
+        :meth:`.to_file`.
+        """
+        if extension_contains(".jsonl", path):
+            save_to_jsonl_compact(self.to_dicts(), path)
+        else:
+            self.to_file(path)
+
 
 def deserialize_item(data: dict) -> Any:
     # Figures out what type of manifest is being decoded with some heuristics
@@ -519,7 +519,11 @@ class SupervisionSet(Serializable, AlgorithmMixin):
 
     @staticmethod
     def from_segments(segments: Iterable[SupervisionSegment]) -> "SupervisionSet":
-        return SupervisionSet(list(segments))
+        # The manifest never mutates its backing list, so an input list
+        # can be taken as-is without a defensive copy.
+        return SupervisionSet(
+            segments if isinstance(segments, list) else list(segments)
+        )
 
     from_items = from_segments
 
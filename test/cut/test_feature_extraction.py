@@ -1,7 +1,6 @@
 import multiprocessing
 import sys
 from concurrent.futures.process import ProcessPoolExecutor
-from functools import partial
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from unittest.mock import Mock
 
@@ -24,6 +23,7 @@ from lhotse import (
     MonoCut,
     Recording,
     Spectrogram,
+    SpectrogramsFbank,
     SupervisionSegment,
     TorchaudioFbank,
     TorchaudioMfcc,
@@ -37,7 +37,9 @@ from lhotse.utils import is_module_available
 from lhotse.utils import nullcontext as does_not_raise
 
 
-@pytest.fixture
+# The manifests below are never mutated by the tests (resampling, appending
+# etc. return new objects), so they are shared across the whole module.
+@pytest.fixture(scope="module")
 def recording():
     return Recording(
         id="rec",
@@ -50,7 +52,7 @@ def recording():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cut(recording):
     return MonoCut(
         id="cut",
@@ -98,12 +100,26 @@ def test_extract_and_store_features_from_mixed_cut(cut, mix_eagerly):
     assert arr.shape[1] == extractor.feature_dim(mixed_cut.sampling_rate)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cut_set(cut):
     # The padding tests if feature extraction works correctly with a PaddingCut
     return CutSet.from_cuts([cut, cut.append(cut).pad(3.0)]).sort_by_duration()
 
 
+@pytest.fixture(scope="module")
+def cut_set_16k(cut_set):
+    # Resampling is hoisted out of the parametrized tests so it runs once
+    # per module instead of once per param case.
+    return cut_set.resample(16000)
+
+
+@pytest.fixture(scope="module")
+def fbank_8k():
+    # Fbank is stateless after construction (config + filterbank matrix),
+    # so a single instance is shared across the param matrix.
+    return Fbank(FbankConfig(sampling_rate=8000))
+
+
 # The lines below try to import Dask (a distributed computing library for Python)
 # so that we can test that parallel feature extraction through the "executor"
 # interface works correctly in this case. Dask in not a requirement or a dependency
@@ -125,23 +141,25 @@ def is_dask_availabe():
         return False
 
 
+@pytest.fixture(scope="session")
+def spawn_pool():
+    # Spawning a worker costs ~100 ms; share one pool across the whole
+    # storage-type x mix-eagerly matrix instead of forking one per case.
+    # For some reason in tests, we need to use the "spawn" context otherwise it hangs
+    pool = ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("spawn")
+    )
+    yield pool
+    pool.shutdown()
+
+
 @pytest.mark.parametrize("mix_eagerly", [False, True])
 @pytest.mark.parametrize("storage_type", [LilcomFilesWriter, LilcomChunkyWriter])
 @pytest.mark.parametrize(
     ["executor", "num_jobs"],
     [
         (None, 1),
-        # For some reason in tests, we need to use the "spawn" context otherwise it hangs
-        pytest.param(
-            partial(
-                ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
-            ),
-            2,
-            marks=pytest.mark.skipif(
-                sys.version_info[0] == 3 and sys.version_info[1] < 7,
-                reason="The mp_context argument is introduced in Python 3.7",
-            ),
-        ),
+        ("spawn_pool", 2),
         pytest.param(
             distributed.Client,
             2,
@@ -149,17 +167,22 @@ def is_dask_availabe():
         ),
     ],
 )
+@pytest.mark.xdist_group(name="feature_extraction")
 def test_extract_and_store_features_from_cut_set(
-    cut_set, executor, num_jobs, storage_type, mix_eagerly
+    cut_set, fbank_8k, executor, num_jobs, storage_type, mix_eagerly, request
 ):
-    extractor = Fbank(FbankConfig(sampling_rate=8000))
+    if executor == "spawn_pool":
+        executor = request.getfixturevalue("spawn_pool")
+    elif executor is not None:
+        executor = executor()
+    extractor = fbank_8k
     with TemporaryDirectory() as tmpdir:
         cut_set_with_feats = cut_set.compute_and_store_features(
             extractor=extractor,
             storage_path=tmpdir,
             num_jobs=num_jobs,
             mix_eagerly=mix_eagerly,
-            executor=executor() if executor else None,
+            executor=executor,
             storage_type=storage_type,
         ).sort_by_duration()  # sort by duration to ensure the same order of cuts
 
@@ -233,11 +256,18 @@ def is_python_311_or_higher() -> bool:
                 ),
             ],
         ),
+        pytest.param(
+            SpectrogramsFbank,
+            marks=pytest.mark.skipif(
+                not is_module_available("spectrograms"),
+                reason="Requires spectrograms to run.",
+            ),
+        ),
     ],
 )
-def test_cut_set_batch_feature_extraction(cut_set, extractor_type):
+def test_cut_set_batch_feature_extraction(cut_set_16k, extractor_type):
     extractor = extractor_type()
-    cut_set = cut_set.resample(16000)
+    cut_set = cut_set_16k
     with NamedTemporaryFile() as tmpf:
         cut_set_with_feats = cut_set.compute_and_store_features_batch(
             extractor=extractor,
@@ -270,9 +300,9 @@ def test_cut_set_batch_feature_extraction(cut_set, extractor_type):
         ),
     ],
 )
-def test_cut_set_batch_feature_extraction_with_collation(cut_set, extractor_type):
+def test_cut_set_batch_feature_extraction_with_collation(cut_set_16k, extractor_type):
     extractor = extractor_type()
-    cut_set = cut_set.resample(16000)
+    cut_set = cut_set_16k
     with NamedTemporaryFile() as tmpf:
         cut_set_with_feats = cut_set.compute_and_store_features_batch(
             extractor=extractor,
@@ -291,10 +321,10 @@ def test_cut_set_batch_feature_extraction_with_collation(cut_set, extractor_type
     ],
 )
 def test_cut_set_batch_feature_extraction_manifest_path(
-    cut_set, suffix, exception_expectation
+    cut_set_16k, suffix, exception_expectation
 ):
     extractor = Fbank()
-    cut_set = cut_set.resample(16000)
+    cut_set = cut_set_16k
     with NamedTemporaryFile() as feat_f, NamedTemporaryFile(
         suffix=suffix
     ) as manifest_f:
@@ -309,14 +339,14 @@ def test_cut_set_batch_feature_extraction_manifest_path(
 
 
 @pytest.mark.parametrize("overwrite", [False, True])
-def test_cut_set_batch_feature_extraction_resume(cut_set, overwrite):
+def test_cut_set_batch_feature_extraction_resume(cut_set_16k, overwrite):
     # This test checks that we can keep writing to the same file
     # and the previously written results are not lost.
     # Since we don't have an easy way to interrupt the execution in a test,
     # we just write another CutSet to the same file.
     # The effect is the same.
     extractor = Fbank()
-    cut_set = cut_set.resample(16000)
+    cut_set = cut_set_16k
     subsets = cut_set.split(num_splits=2)
     processed = []
     with NamedTemporaryFile() as feat_f, NamedTemporaryFile(
@@ -372,24 +402,29 @@ def test_cut_set_batch_feature_extraction_resume(cut_set, overwrite):
                 ),
             ],
         ),
+        pytest.param(
+            SpectrogramsFbank,
+            marks=pytest.mark.skipif(
+                not is_module_available("spectrograms"),
+                reason="Requires spectrograms to run.",
+            ),
+        ),
     ],
 )
-def test_on_the_fly_batch_feature_extraction(cut_set, extractor_type):
+def test_on_the_fly_batch_feature_extraction(cut_set_16k, extractor_type):
     from lhotse.dataset import OnTheFlyFeatures
 
     extractor = OnTheFlyFeatures(extractor=extractor_type())
-    cut_set = cut_set.resample(16000)
-    feats, feat_lens = extractor(cut_set)  # does not crash
+    feats, feat_lens = extractor(cut_set_16k)  # does not crash
     assert isinstance(feats, torch.Tensor)
     assert isinstance(feat_lens, torch.Tensor)
 
 
-def test_on_the_fly_feats_return_audio(cut_set):
+def test_on_the_fly_feats_return_audio(cut_set_16k):
     from lhotse.dataset import OnTheFlyFeatures
 
     extractor = OnTheFlyFeatures(extractor=Fbank(), return_audio=True)
-    cut_set = cut_set.resample(16000)
-    feats, feat_lens, audios, audio_lens = extractor(cut_set)
+    feats, feat_lens, audios, audio_lens = extractor(cut_set_16k)
     assert isinstance(feats, torch.Tensor)
     assert isinstance(feat_lens, torch.Tensor)
     assert isinstance(audios, torch.Tensor)
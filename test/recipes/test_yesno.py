@@ -0,0 +1,23 @@
+from lhotse.recipes.test import download_test
+
+
+def test_download_test_skips_extraction_when_all_wavs_present(tmp_path, monkeypatch):
+    # Simulate a previous run that crashed after extracting all 60 wavs
+    # but before touching the completed detector.
+    extracted_dir = tmp_path / "waves_yesno"
+    extracted_dir.mkdir()
+    for i in range(60):
+        (extracted_dir / f"{i:02d}.wav").touch()
+    (tmp_path / "waves_yesno.tar.gz").touch()
+
+    monkeypatch.setattr(
+        "lhotse.recipes.test.resumable_download", lambda *args, **kwargs: None
+    )
+
+    def fail_extract(*args, **kwargs):
+        raise AssertionError("The extraction should have been skipped.")
+
+    monkeypatch.setattr("lhotse.recipes.test._extract_in_memory", fail_extract)
+
+    assert download_test(tmp_path) == extracted_dir
+    assert (extracted_dir / ".completed").is_file()
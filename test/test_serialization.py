@@ -345,6 +345,27 @@ def test_generic_serialization_classmethod(
     assert manifest == restored
 
 
+@pytest.mark.parametrize(
+    "manifest_type", ["recording_set", "supervision_set", "feature_set", "cut_set"]
+)
+@pytest.mark.parametrize(
+    ["format", "compressed"],
+    [
+        ("jsonl", False),
+        ("jsonl", True),
+        # Non-JSONL paths fall back to the regular to_file.
+        ("json", False),
+        ("json", True),
+    ],
+)
+def test_compact_serialization(manifests, manifest_type, format, compressed):
+    manifest = manifests[manifest_type]
+    with NamedTemporaryFile(suffix="." + format + (".gz" if compressed else "")) as f:
+        manifest.to_file_compact(f.name)
+        restored = type(manifest).from_file(f.name).to_eager()
+    assert manifest == restored
+
+
 @pytest.mark.parametrize(
     "manifest_type", ["recording_set", "supervision_set", "feature_set", "cut_set"]
 )